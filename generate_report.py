@@ -25,14 +25,26 @@ def compute_keyword_signals(df: pd.DataFrame, top_n: int = 10):
     threshold = df["points"].quantile(0.75)
     df = df.copy()
     df["label"] = (df["points"] >= threshold).astype(int)
-    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), min_df=2)
+    # float32 halves memory traffic through the sparse matrix; liblinear is
+    # the fast solver for small sparse binary problems like this one.
+    vectorizer = TfidfVectorizer(
+        stop_words="english", ngram_range=(1, 2), min_df=2, dtype=np.float32
+    )
     X = vectorizer.fit_transform(df["title"])
-    clf = LogisticRegression(max_iter=200, class_weight="balanced")
+    clf = LogisticRegression(
+        max_iter=200, class_weight="balanced", solver="liblinear"
+    )
     clf.fit(X, df["label"])
     feature_names = np.array(vectorizer.get_feature_names_out())
     coefs = clf.coef_[0]
-    top_idx = np.argsort(coefs)[-top_n:][::-1]
-    bottom_idx = np.argsort(coefs)[:top_n]
+    # argpartition selects the extremes in O(V); only the 2*top_n survivors
+    # need an actual sort. Small collections can leave the pruned vocabulary
+    # below top_n, so clamp the selection size to what actually exists.
+    k = min(top_n, len(coefs))
+    top_idx = np.argpartition(coefs, -k)[-k:]
+    top_idx = top_idx[np.argsort(coefs[top_idx])[::-1]]
+    bottom_idx = np.argpartition(coefs, k - 1)[:k]
+    bottom_idx = bottom_idx[np.argsort(coefs[bottom_idx])]
     top_tokens = list(zip(feature_names[top_idx], coefs[top_idx]))
     low_tokens = list(zip(feature_names[bottom_idx], coefs[bottom_idx]))
     return top_tokens, low_tokens
@@ -11,10 +11,15 @@ from __future__ import annotations
 
 import argparse
 import csv
+import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+PROC_NET_DEV = "/proc/net/dev"
 
 
 @dataclass
@@ -25,8 +30,23 @@ class Sample:
     tx_mbps: float
 
 
-def read_bytes(path: Path) -> int:
-    return int(path.read_text().strip())
+def _read_counters(fd: int, needle: bytes) -> Tuple[int, int]:
+    """Return (rx_bytes, tx_bytes) for one interface from /proc/net/dev.
+
+    The proc file lists every interface's counters in one read, so a single
+    pread replaces the two sysfs reads per tick. Per the kernel docs, the
+    first field after the interface name is rx_bytes and the ninth is
+    tx_bytes.
+    """
+    buf = os.pread(fd, 65536, 0)
+    for line in buf.splitlines():
+        # Interface names only ever start a line, so anchor the match there;
+        # a plain substring search would let "eth0:" hit inside "veth0:".
+        stripped = line.lstrip()
+        if stripped.startswith(needle):
+            fields = stripped[len(needle) :].split()
+            return int(fields[0]), int(fields[8])
+    raise RuntimeError(f"Interface entry {needle!r} missing from {PROC_NET_DEV}.")
 
 
 def sample_interface(interface: str, duration: int, interval: float) -> List[Sample]:
@@ -36,45 +56,60 @@ def sample_interface(interface: str, duration: int, interval: float) -> List[Sam
             f"Interface '{interface}' not found under /sys/class/net."
         )
 
-    rx_path = base / "rx_bytes"
-    tx_path = base / "tx_bytes"
-    rx_prev = read_bytes(rx_path)
-    tx_prev = read_bytes(tx_path)
-    time_prev = time.time()
-    time_start = time_prev
-    samples: List[Sample] = []
-
-    # The first delta arrives after one interval.
-    while True:
-        time.sleep(interval)
-        now = time.time()
-        elapsed = now - time_start
-        if elapsed > duration:
-            break
-
-        rx_curr = read_bytes(rx_path)
-        tx_curr = read_bytes(tx_path)
-        delta_t = now - time_prev
-        if delta_t <= 0:
-            continue
-
-        rx_rate = (rx_curr - rx_prev) * 8 / 1_000_000 / delta_t
-        tx_rate = (tx_curr - tx_prev) * 8 / 1_000_000 / delta_t
-
-        samples.append(
-            Sample(
-                elapsed=round(elapsed, 2),
-                timestamp_iso=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)),
-                rx_mbps=max(rx_rate, 0.0),
-                tx_mbps=max(tx_rate, 0.0),
-            )
+    # One fd on /proc/net/dev, held open across the run and reread from
+    # offset 0 each tick, yields both counters in a single syscall.
+    fd = os.open(PROC_NET_DEV, os.O_RDONLY)
+    needle = f"{interface}:".encode()
+    try:
+        capacity = max(int(duration / interval) + 1, 1)
+        elapsed_arr = np.empty(capacity, dtype=np.float64)
+        wall_arr = np.empty(capacity, dtype=np.float64)
+        rx_arr = np.empty(capacity, dtype=np.float32)
+        tx_arr = np.empty(capacity, dtype=np.float32)
+
+        rx_prev, tx_prev = _read_counters(fd, needle)
+        time_prev = time.monotonic()
+        time_start = time_prev
+        deadline = time_start
+        count = 0
+
+        # Sleep towards absolute deadlines so samples land on an even grid;
+        # relative sleeps would accumulate scheduler jitter into the rates.
+        # The first delta arrives after one interval.
+        while count < capacity:
+            deadline += interval
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            now = time.monotonic()
+            elapsed = now - time_start
+            if elapsed > duration:
+                break
+
+            rx_curr, tx_curr = _read_counters(fd, needle)
+            delta_t = now - time_prev
+
+            elapsed_arr[count] = elapsed
+            wall_arr[count] = time.time()
+            rx_arr[count] = max((rx_curr - rx_prev) * 8 / 1_000_000 / delta_t, 0.0)
+            tx_arr[count] = max((tx_curr - tx_prev) * 8 / 1_000_000 / delta_t, 0.0)
+            count += 1
+
+            rx_prev = rx_curr
+            tx_prev = tx_curr
+            time_prev = now
+    finally:
+        os.close(fd)
+
+    return [
+        Sample(
+            elapsed=round(float(elapsed_arr[i]), 2),
+            timestamp_iso=time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(wall_arr[i])
+            ),
+            rx_mbps=float(rx_arr[i]),
+            tx_mbps=float(tx_arr[i]),
         )
-
-        rx_prev = rx_curr
-        tx_prev = tx_curr
-        time_prev = now
-
-    return samples
+        for i in range(count)
+    ]
 
 
 def write_csv(path: Path, samples: Iterable[Sample]) -> None:
@@ -1,17 +1,35 @@
 from __future__ import annotations
 
-import threading
+import asyncio
 import html
+import re
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
-import requests
+import httpx
+import orjson
 
 from .base import RequestEvent, ScraperResult, ScraperStats, Timer
-from .utils import build_record
+from .http_cache import ResponseCache
+from .utils import append_record, new_record_columns
 
 API_BASE = "https://hacker-news.firebaseio.com/v0"
+CACHE_PATH = Path("data/cache/hn_api.sqlite")
+# topstories.json churns constantly; item payloads drift slowly (scores move,
+# titles/authors do not), so they get a much longer lifetime.
+TOPSTORIES_TTL_S = 60.0
+ITEM_TTL_S = 3600.0
+DEFAULT_TTL_S = 600.0
+
+# Firebase comment bodies separate paragraphs with <p> tags; one compiled
+# pass maps opening tags to newlines and drops the (rare) closing ones.
+_P_TAG_RE = re.compile(r"</?p>")
+_P_TAG_SUBS = {"<p>": "\n", "</p>": ""}
+
+
+def _strip_paragraph_tags(text: str) -> str:
+    return _P_TAG_RE.sub(lambda match: _P_TAG_SUBS[match.group(0)], text)
 
 
 class HackerNewsAPIScraper:
@@ -20,22 +38,41 @@ class HackerNewsAPIScraper:
     def __init__(
         self,
         *,
-        session: Optional[requests.Session] = None,
         throttle_s: float = 0.2,
         max_workers: int = 5,
+        force_refresh: bool = False,
+        cache_path: Path = CACHE_PATH,
     ) -> None:
-        self.session = session or requests.Session()
         self.throttle_s = throttle_s
+        self.force_refresh = force_refresh
+        self._cache = ResponseCache(cache_path)
         self._events: List[RequestEvent] = []
-        self._lock = threading.Lock()
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.BoundedSemaphore] = None
         self._max_workers = max_workers
 
-    def _tracked_get(self, endpoint: str, *, timeout: int = 15) -> dict:
+    @staticmethod
+    def _ttl_for(endpoint: str) -> float:
+        if endpoint == "topstories.json":
+            return TOPSTORIES_TTL_S
+        if endpoint.startswith("item/"):
+            return ITEM_TTL_S
+        return DEFAULT_TTL_S
+
+    async def _tracked_get(self, client: httpx.AsyncClient, endpoint: str) -> dict:
         url = f"{API_BASE}/{endpoint}"
+        if not self.force_refresh:
+            cached = self._cache.get(url, self._ttl_for(endpoint))
+            if cached is not None:
+                # Cache hits cost no network round-trip, so no RequestEvent.
+                return orjson.loads(cached)
         start = time.perf_counter()
-        response = self.session.get(url, timeout=timeout)
+        response = await client.get(url)
         elapsed_ms = (time.perf_counter() - start) * 1000
-        bytes_read = len(response.content)
+        body = response.content
+        # Content-Length is the on-the-wire size; fall back to the decoded
+        # body length when the header is absent.
+        bytes_read = int(response.headers.get("Content-Length", len(body)))
         event = RequestEvent(
             url=url,
             method="GET",
@@ -44,15 +81,17 @@ class HackerNewsAPIScraper:
             bytes_read=bytes_read,
             timestamp=time.time(),
         )
-        with self._lock:
+        async with self._lock:
             self._events.append(event)
         if self.throttle_s > 0:
-            time.sleep(self.throttle_s)
+            await asyncio.sleep(self.throttle_s)
         response.raise_for_status()
-        return response.json()
+        self._cache.put(url, body)
+        return orjson.loads(body)
 
-    def _process_post(self, post_id: int) -> dict:
-        data = self._tracked_get(f"item/{post_id}.json")
+    async def _process_post(self, client: httpx.AsyncClient, post_id: int) -> dict:
+        async with self._semaphore:
+            data = await self._tracked_get(client, f"item/{post_id}.json")
         title = data.get("title", "")
         url = data.get("url", f"https://news.ycombinator.com/item?id={post_id}")
         points = data.get("score", 0)
@@ -63,31 +102,46 @@ class HackerNewsAPIScraper:
         top_comment_author = ""
         top_comment_text = ""
         if comments_ids:
-            comment_data = self._tracked_get(f"item/{comments_ids[0]}.json")
+            async with self._semaphore:
+                comment_data = await self._tracked_get(
+                    client, f"item/{comments_ids[0]}.json"
+                )
             top_comment_author = comment_data.get("by", "") or ""
             comment_text = comment_data.get("text", "") or ""
-            top_comment_text = html.unescape(
-                comment_text.replace("<p>", "\n").replace("</p>", "")
-            )
+            top_comment_text = html.unescape(_strip_paragraph_tags(comment_text))
 
-        return build_record(
-            post_id=post_id,
-            title=title,
-            url=url,
-            points=points,
-            comments_count=comments_count,
-            author=author,
-            top_comment_author=top_comment_author,
-            top_comment_text=top_comment_text,
-        )
+        return {
+            "post_id": post_id,
+            "title": title,
+            "url": url,
+            "points": points,
+            "comments_count": comments_count,
+            "author": author,
+            "top_comment_author": top_comment_author,
+            "top_comment_text": top_comment_text,
+        }
+
+    async def _run_async(self, limit: int) -> Dict[str, List]:
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.BoundedSemaphore(self._max_workers)
+        # HTTP/2 multiplexes every concurrent GET over one TCP+TLS session, so
+        # a single connection replaces the per-worker socket pool.
+        limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+        async with httpx.AsyncClient(
+            http2=True, limits=limits, timeout=15.0
+        ) as client:
+            top_ids = (await self._tracked_get(client, "topstories.json"))[:limit]
+            fetched = await asyncio.gather(
+                *(self._process_post(client, post_id) for post_id in top_ids)
+            )
+            cols = new_record_columns()
+            for record in fetched:
+                append_record(cols, **record)
+            return cols
 
     def run(self, limit: int = 30) -> ScraperResult:
-        records = []
         with Timer() as timer:
-            top_ids = self._tracked_get("topstories.json")[:limit]
-            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
-                for record in executor.map(self._process_post, top_ids):
-                    records.append(record)
+            records = asyncio.run(self._run_async(limit))
 
         total_bytes = sum(event.bytes_read for event in self._events)
         total_requests = len(self._events)
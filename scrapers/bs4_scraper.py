@@ -1,42 +1,88 @@
 from __future__ import annotations
 
+import asyncio
+import html
+import re
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-import requests
+import httpx
+import orjson
+import soupsieve as sv
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lhtml
 
 from .base import RequestEvent, ScraperResult, ScraperStats, Timer
-from .utils import build_record, extract_front_page_items, parse_comments, parse_points
+from .utils import append_record, new_record_columns, parse_comments, parse_points
 
 FRONT_PAGE_URL = "https://news.ycombinator.com/"
 DISCUSSION_URL = "https://news.ycombinator.com/item?id={post_id}"
+# Algolia serves the whole comment tree as a few KB of JSON, versus tens to
+# hundreds of KB of discussion HTML for the same first comment.
+ALGOLIA_ITEM_URL = "https://hn.algolia.com/api/v1/items/{post_id}"
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Front-page extraction goes through lxml directly: the document is parsed
+# once into an element tree and compiled XPath expressions pull every field,
+# skipping the BeautifulSoup tag-wrapper layer entirely on the hot path.
+_XP_ROWS = etree.XPath("//tr[contains(@class, 'athing')]")
+_XP_TITLE_A = etree.XPath(".//span[contains(@class, 'titleline')]/a[1]")
+_XP_SCORE = etree.XPath(
+    "following-sibling::tr[1]//span[contains(@class, 'score')]"
+)
+_XP_AUTHOR = etree.XPath(
+    "following-sibling::tr[1]//a[contains(@class, 'hnuser')]"
+)
+_XP_LAST_A = etree.XPath(
+    "(following-sibling::tr[1]//td[contains(@class, 'subtext')]//a)[last()]"
+)
+
+# The discussion-page fallback still runs through BeautifulSoup; these
+# selectors are compiled once rather than re-parsed per select call.
+_SEL_COMTR = sv.compile(".comment-tree .comtr")
+_SEL_HNUSER = sv.compile("a.hnuser")
+_SEL_COMMTEXT = sv.compile("span.commtext")
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
-    "Chrome/123.0 Safari/537.36"
+    "Chrome/123.0 Safari/537.36",
+    "Connection": "keep-alive",
+    "Accept-Encoding": "gzip, deflate, br",
 }
 
 
 class BeautifulSoupScraper:
-    """HTML scraping using requests + BeautifulSoup."""
+    """HTML scraping using httpx + BeautifulSoup."""
 
     def __init__(
         self,
         *,
-        session: Optional[requests.Session] = None,
-        throttle_s: float = 0.5,
+        max_rps: float = 2.0,
+        concurrency: int = 5,
     ) -> None:
-        self.session = session or requests.Session()
-        self.session.headers.update(DEFAULT_HEADERS)
-        self.throttle_s = throttle_s
+        # Token bucket: concurrent bursts go out immediately while the
+        # sustained request rate stays capped, instead of a fixed sleep
+        # after every response.
+        self._limiter = AsyncLimiter(max_rate=max_rps, time_period=1.0)
+        self._concurrency = concurrency
         self._events: List[RequestEvent] = []
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.BoundedSemaphore] = None
 
-    def _tracked_get(self, url: str, *, timeout: int = 15) -> requests.Response:
-        start = time.perf_counter()
-        response = self.session.get(url, timeout=timeout)
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        bytes_read = len(response.content)
+    async def _tracked_get(
+        self, client: httpx.AsyncClient, url: str
+    ) -> httpx.Response:
+        async with self._limiter:
+            start = time.perf_counter()
+            response = await client.get(url)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        # Content-Length is the compressed on-the-wire size; HN gzips its
+        # HTML, so the decoded body would overstate bandwidth several-fold.
+        bytes_read = int(
+            response.headers.get("Content-Length", len(response.content))
+        )
         event = RequestEvent(
             url=url,
             method="GET",
@@ -45,72 +91,148 @@ class BeautifulSoupScraper:
             bytes_read=bytes_read,
             timestamp=time.time(),
         )
-        self._events.append(event)
-        if self.throttle_s > 0:
-            time.sleep(self.throttle_s)
+        async with self._lock:
+            self._events.append(event)
         response.raise_for_status()
         return response
 
-    def _parse_discussion(
-        self, post_id: int
+    async def _fetch_discussion(
+        self, client: httpx.AsyncClient, post_id: int
     ) -> BeautifulSoup:
-        response = self._tracked_get(DISCUSSION_URL.format(post_id=post_id))
-        return BeautifulSoup(response.text, "html.parser")
+        async with self._semaphore:
+            response = await self._tracked_get(
+                client, DISCUSSION_URL.format(post_id=post_id)
+            )
+        return BeautifulSoup(response.content, "lxml")
+
+    async def _fetch_top_comment(
+        self, client: httpx.AsyncClient, post_id: int
+    ) -> Dict[str, Optional[str]]:
+        try:
+            async with self._semaphore:
+                response = await self._tracked_get(
+                    client, ALGOLIA_ITEM_URL.format(post_id=post_id)
+                )
+            data = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            # Fall back to scraping the discussion page if Algolia is
+            # unavailable or lags behind the front page.
+            soup = await self._fetch_discussion(client, post_id)
+            return self._first_comment(soup) or {"author": "", "text": ""}
+        children = data.get("children") or []
+        if not children:
+            return {"author": "", "text": ""}
+        first = children[0]
+        text = html.unescape(_HTML_TAG_RE.sub("", first.get("text") or ""))
+        return {"author": first.get("author") or "", "text": text.strip()}
 
     def _first_comment(self, soup: BeautifulSoup) -> Optional[dict]:
-        comment = soup.select_one(".comment-tree .comtr .comment")
-        if not comment:
+        # The author anchor always lives inside the same tr.comtr as the
+        # comment body, so scope both lookups to that small subtree rather
+        # than walking the whole document backwards with find_previous.
+        comtr = _SEL_COMTR.select_one(soup)
+        if not comtr:
             return None
-        author_tag = comment.find_previous("a", class_="hnuser")
+        author_tag = _SEL_HNUSER.select_one(comtr)
+        text_tag = _SEL_COMMTEXT.select_one(comtr) or comtr
         return {
             "author": author_tag.get_text(strip=True) if author_tag else None,
-            "text": comment.get_text(strip=True),
+            "text": text_tag.get_text(strip=True),
         }
 
-    def run(self, limit: int = 30) -> ScraperResult:
-        records = []
-        with Timer() as timer:
-            front_page = self._tracked_get(FRONT_PAGE_URL)
-            soup = extract_front_page_items(front_page.text)
-            items = soup.select("tr.athing")
-            for idx, item in enumerate(items):
-                if idx >= limit:
-                    break
-                post_id = int(item.get("id"))
-                title = item.select_one("span.titleline a").get_text(strip=True)
-                url = item.select_one("span.titleline a")["href"]
-                meta_row = item.find_next_sibling("tr")
-                points_tag = meta_row.select_one("span.score")
-                subtext = meta_row.select_one("td.subtext")
-                author_tag = subtext.select_one("a.hnuser") if subtext else None
-                comments_link = subtext.find_all("a")[-1] if subtext else None
-
-                points = parse_points(points_tag.get_text() if points_tag else "")
-                comments_count = parse_comments(
-                    comments_link.get_text() if comments_link else ""
+    async def _run_async(self, limit: int) -> Dict[str, List]:
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.BoundedSemaphore(self._concurrency)
+        # Keep idle sockets warm across rate-limit waits so no fetch pays a
+        # fresh TCP+TLS handshake; retry transient connect failures twice.
+        limits = httpx.Limits(
+            max_connections=self._concurrency,
+            max_keepalive_connections=self._concurrency,
+            keepalive_expiry=30.0,
+        )
+        # The limits must go to the transport: httpx ignores the client's
+        # limits= kwarg whenever an explicit transport is supplied.
+        transport = httpx.AsyncHTTPTransport(retries=2, limits=limits)
+        async with httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            transport=transport,
+            timeout=15.0,
+            follow_redirects=True,
+        ) as client:
+            front_page = await self._tracked_get(client, FRONT_PAGE_URL)
+            tree = lhtml.fromstring(front_page.content)
+            rows = _XP_ROWS(tree)[:limit]
+
+            partials: List[Dict] = []
+            for row in rows:
+                title_a = next(iter(_XP_TITLE_A(row)), None)
+                score = next(iter(_XP_SCORE(row)), None)
+                author = next(iter(_XP_AUTHOR(row)), None)
+                last_a = next(iter(_XP_LAST_A(row)), None)
+
+                partials.append(
+                    {
+                        "post_id": int(row.get("id")),
+                        "title": (
+                            title_a.text_content().strip()
+                            if title_a is not None
+                            else ""
+                        ),
+                        "url": (
+                            title_a.get("href", "") if title_a is not None else ""
+                        ),
+                        "points": parse_points(
+                            score.text_content() if score is not None else ""
+                        ),
+                        "comments_count": parse_comments(
+                            last_a.text_content() if last_a is not None else ""
+                        ),
+                        "author": (
+                            author.text_content().strip()
+                            if author is not None
+                            else ""
+                        ),
+                    }
+                )
+
+            # All top-comment fetches run concurrently, bounded by the
+            # semaphore inside _fetch_top_comment.
+            tasks = {
+                partial["post_id"]: asyncio.create_task(
+                    self._fetch_top_comment(client, partial["post_id"])
                 )
+                for partial in partials
+                if partial["comments_count"] > 0
+            }
+            if tasks:
+                await asyncio.gather(*tasks.values())
 
+            cols = new_record_columns()
+            for partial in partials:
                 top_comment_author = ""
                 top_comment_text = ""
-                if comments_count > 0:
-                    discussion_soup = self._parse_discussion(post_id)
-                    comment = self._first_comment(discussion_soup)
-                    if comment:
-                        top_comment_author = comment.get("author") or ""
-                        top_comment_text = comment.get("text") or ""
-
-                records.append(
-                    build_record(
-                        post_id=post_id,
-                        title=title,
-                        url=url,
-                        points=points,
-                        comments_count=comments_count,
-                        author=author_tag.get_text(strip=True) if author_tag else "",
-                        top_comment_author=top_comment_author,
-                        top_comment_text=top_comment_text,
-                    )
+                task = tasks.get(partial["post_id"])
+                if task is not None:
+                    comment = task.result()
+                    top_comment_author = comment.get("author") or ""
+                    top_comment_text = comment.get("text") or ""
+
+                append_record(
+                    cols,
+                    post_id=partial["post_id"],
+                    title=partial["title"],
+                    url=partial["url"],
+                    points=partial["points"],
+                    comments_count=partial["comments_count"],
+                    author=partial["author"],
+                    top_comment_author=top_comment_author,
+                    top_comment_text=top_comment_text,
                 )
+            return cols
+
+    def run(self, limit: int = 30) -> ScraperResult:
+        with Timer() as timer:
+            records = asyncio.run(self._run_async(limit))
 
         total_bytes = sum(event.bytes_read for event in self._events)
         total_requests = len(self._events)
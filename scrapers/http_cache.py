@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class ResponseCache:
+    """On-disk TTL cache for HTTP response bodies, keyed by URL.
+
+    Backed by a single sqlite table so repeated ``collect_data.py`` runs can
+    skip refetching Firebase items whose payloads rarely change within a
+    polling window. Entries older than the TTL supplied at lookup time are
+    treated as misses, so callers can use different lifetimes per endpoint.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # The cache is built on the main thread but used from whichever
+        # worker thread runs the scraper (collect_data's executor), which
+        # sqlite forbids by default; allow cross-thread use and serialize
+        # every statement behind our own lock instead.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, body BLOB NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, url: str, ttl_s: float) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, fetched_at = row
+        if time.time() - fetched_at > ttl_s:
+            return None
+        return body
+
+    def put(self, url: str, body: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (url, body, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-import json
 import time
-from contextlib import contextmanager
 from typing import Dict, List, Optional
 
+try:
+    # orjson parses the CDP log messages several times faster than the
+    # stdlib; fall back silently when it is not installed.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import ChromeService
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -14,11 +19,60 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from .base import RequestEvent, ScraperResult, ScraperStats, Timer
-from .utils import build_record, parse_comments, parse_points
+from .utils import append_record, new_record_columns, parse_comments, parse_points
 
 FRONT_PAGE_URL = "https://news.ycombinator.com/"
 DISCUSSION_BASE = "https://news.ycombinator.com/"
 
+# We only read the DOM, so static assets are dead weight; blocked at the
+# CDP layer so the browser never issues the requests.
+_BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.gif",
+    "*.css",
+    "*.woff*",
+    "*.ico",
+    "*favicon*",
+]
+
+# Every find_element/.text access is a JSON-over-HTTP round-trip to
+# chromedriver; these scripts walk the DOM in-page and return one payload.
+_JS_EXTRACT_ROWS = """
+const limit = arguments[0];
+return Array.from(document.querySelectorAll('tr.athing')).slice(0, limit)
+  .map((row) => {
+    const sub = row.nextElementSibling
+      ? row.nextElementSibling.querySelector('td.subtext')
+      : null;
+    const links = sub ? sub.querySelectorAll('a') : [];
+    const last = links.length ? links[links.length - 1] : null;
+    const title = row.querySelector('span.titleline a');
+    const score = sub ? sub.querySelector('span.score') : null;
+    const author = sub ? sub.querySelector('a.hnuser') : null;
+    return {
+      id: row.id,
+      title: title ? title.innerText : '',
+      url: title ? title.href : '',
+      points: score ? score.innerText : '',
+      author: author ? author.innerText : '',
+      comments_text: last ? last.innerText : '',
+      comments_href: last ? last.getAttribute('href') : '',
+    };
+  });
+"""
+
+_JS_EXTRACT_FIRST_COMMENT = """
+const comtr = document.querySelector('.comment-tree .comtr');
+if (!comtr) return {author: '', text: ''};
+const author = comtr.querySelector('a.hnuser');
+const text = comtr.querySelector('span.commtext');
+return {
+  author: author ? author.innerText : '',
+  text: text ? text.innerText : '',
+};
+"""
+
 
 def _resolve_driver_path(driver_path: Optional[str]) -> Optional[str]:
     if driver_path:
@@ -41,33 +95,57 @@ class SeleniumScraper:
         headless: bool = True,
         throttle_s: float = 0.5,
         wait_timeout: int = 10,
+        capture_network: bool = False,
     ) -> None:
         self.driver_path = _resolve_driver_path(driver_path)
         self.headless = headless
         self.throttle_s = throttle_s
         self.wait_timeout = wait_timeout
+        self.capture_network = capture_network
+        self._driver_instance: Optional[webdriver.Chrome] = None
 
-    @contextmanager
-    def _driver(self):
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
-        service = (
-            ChromeService(executable_path=self.driver_path)
-            if self.driver_path
-            else ChromeService()
-        )
-        driver = webdriver.Chrome(service=service, options=options)
-        try:
-            yield driver
-        finally:
-            driver.quit()
+    def _ensure_driver(self) -> webdriver.Chrome:
+        # Chrome startup (process fork, profile creation, CDP handshake)
+        # costs seconds; launch once and reuse the browser across runs.
+        if self._driver_instance is None:
+            options = Options()
+            if self.headless:
+                options.add_argument("--headless=new")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--window-size=1920,1080")
+            options.add_argument("--disable-blink-features=AutomationControlled")
+            if self.capture_network:
+                # Performance logging floods the log buffer with CDP messages;
+                # only pay for it when network events were requested.
+                options.set_capability(
+                    "goog:loggingPrefs", {"performance": "ALL"}
+                )
+            service = (
+                ChromeService(executable_path=self.driver_path)
+                if self.driver_path
+                else ChromeService()
+            )
+            driver = webdriver.Chrome(service=service, options=options)
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS}
+            )
+            self._driver_instance = driver
+        return self._driver_instance
+
+    def close(self) -> None:
+        """Shut down the pooled browser process, if one was started."""
+        if self._driver_instance is not None:
+            self._driver_instance.quit()
+            self._driver_instance = None
+
+    def __enter__(self) -> "SeleniumScraper":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _collect_network_events(self, driver) -> List[RequestEvent]:
         logs = driver.get_log("performance")
@@ -77,7 +155,11 @@ class SeleniumScraper:
         methods: Dict[str, str] = {}
         statuses: Dict[str, int] = {}
         for entry in logs:
-            message = json.loads(entry["message"])
+            # Cheap substring test before parsing: console/page/runtime
+            # entries vastly outnumber the Network.* ones we care about.
+            if "Network." not in entry["message"]:
+                continue
+            message = _json_loads(entry["message"])
             method = message.get("message", {}).get("method")
             params = message.get("message", {}).get("params", {})
             request_id = params.get("requestId")
@@ -112,90 +194,69 @@ class SeleniumScraper:
         return events
 
     def run(self, limit: int = 30) -> ScraperResult:
-        records: List[Dict[str, str]] = []
+        records = new_record_columns()
         events: List[RequestEvent] = []
-        with Timer() as timer, self._driver() as driver:
-            driver.get(FRONT_PAGE_URL)
-            WebDriverWait(driver, self.wait_timeout).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "tr.athing"))
-            )
-            rows = driver.find_elements(By.CSS_SELECTOR, "tr.athing")
-            for idx, row in enumerate(rows):
-                if idx >= limit:
-                    break
-                post_id = int(row.get_attribute("id"))
-                title_el = row.find_element(By.CSS_SELECTOR, "span.titleline a")
-                title = title_el.text
-                url = title_el.get_attribute("href")
-                subtext_row = row.find_element(
-                    By.XPATH, "following-sibling::tr[1]/td[@class='subtext']"
-                )
-                points_el = subtext_row.find_elements(By.CSS_SELECTOR, "span.score")
-                author_el = subtext_row.find_elements(By.CSS_SELECTOR, "a.hnuser")
-                links = subtext_row.find_elements(By.CSS_SELECTOR, "a")
-                comments_link = links[-1] if links else None
-
-                points = parse_points(points_el[0].text if points_el else "")
-                comments_count = parse_comments(
-                    comments_link.text if comments_link else ""
+        driver = self._ensure_driver()
+        with Timer() as timer:
+            try:
+                driver.get(FRONT_PAGE_URL)
+                WebDriverWait(driver, self.wait_timeout).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "tr.athing"))
                 )
-                comment_url = (
-                    comments_link.get_attribute("href") if comments_link else ""
-                )
-                if comment_url and comment_url.startswith("item?id="):
-                    comment_url = DISCUSSION_BASE + comment_url
-
-                top_comment_author = ""
-                top_comment_text = ""
-                if comments_count > 0 and comment_url:
-                    driver.switch_to.new_window("tab")
-                    driver.get(comment_url)
-                    try:
-                        WebDriverWait(driver, self.wait_timeout).until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, ".comment-tree .comtr")
+                rows = driver.execute_script(_JS_EXTRACT_ROWS, limit)
+                for row in rows:
+                    post_id = int(row["id"])
+                    points = parse_points(row["points"])
+                    comments_count = parse_comments(row["comments_text"])
+                    comment_url = row["comments_href"] or ""
+                    if comment_url and comment_url.startswith("item?id="):
+                        comment_url = DISCUSSION_BASE + comment_url
+
+                    top_comment_author = ""
+                    top_comment_text = ""
+                    if comments_count > 0 and comment_url:
+                        driver.switch_to.new_window("tab")
+                        driver.get(comment_url)
+                        try:
+                            WebDriverWait(driver, self.wait_timeout).until(
+                                EC.presence_of_element_located(
+                                    (By.CSS_SELECTOR, ".comment-tree .comtr")
+                                )
                             )
-                        )
-                        comments = driver.find_elements(
-                            By.CSS_SELECTOR, ".comment-tree .comtr"
-                        )
-                        if comments:
-                            first = comments[0]
-                            try:
-                                top_comment_text = first.find_element(
-                                    By.CSS_SELECTOR, "span.commtext"
-                                ).text
-                            except NoSuchElementException:
-                                top_comment_text = ""
-                            try:
-                                top_comment_author = first.find_element(
-                                    By.CSS_SELECTOR, "a.hnuser"
-                                ).text
-                            except NoSuchElementException:
-                                top_comment_author = ""
-                    except TimeoutException:
-                        top_comment_author = ""
-                        top_comment_text = ""
-                    finally:
-                        driver.close()
-                        driver.switch_to.window(driver.window_handles[0])
-                        if self.throttle_s > 0:
-                            time.sleep(self.throttle_s)
-
-                records.append(
-                    build_record(
+                            comment = driver.execute_script(_JS_EXTRACT_FIRST_COMMENT)
+                            top_comment_author = comment["author"]
+                            top_comment_text = comment["text"]
+                        except TimeoutException:
+                            top_comment_author = ""
+                            top_comment_text = ""
+                        finally:
+                            driver.close()
+                            driver.switch_to.window(driver.window_handles[0])
+                            if self.throttle_s > 0:
+                                time.sleep(self.throttle_s)
+
+                    append_record(
+                        records,
                         post_id=post_id,
-                        title=title,
-                        url=url,
+                        title=row["title"],
+                        url=row["url"],
                         points=points,
                         comments_count=comments_count,
-                        author=author_el[0].text if author_el else "",
+                        author=row["author"],
                         top_comment_author=top_comment_author,
                         top_comment_text=top_comment_text,
                     )
-                )
 
-            events = self._collect_network_events(driver)
+                if self.capture_network:
+                    events = self._collect_network_events(driver)
+            finally:
+                # Reset per-run state so the pooled browser starts the next
+                # run clean: drop stray tabs and any session cookies.
+                for handle in driver.window_handles[1:]:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+                driver.delete_all_cookies()
         total_bytes = sum(event.bytes_read for event in events)
         total_requests = len(events)
         avg_latency = (
@@ -1,37 +1,66 @@
 from __future__ import annotations
 
-import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup
 
+# Column order for scraper output; records are stored as a dict of parallel
+# lists (one per field) rather than one small dict per row.
+FIELDS = (
+    "post_id",
+    "title",
+    "url",
+    "points",
+    "comments_count",
+    "author",
+    "top_comment_author",
+    "top_comment_text",
+)
 
-POINTS_RE = re.compile(r"(\d+)\s+points?")
-COMMENTS_RE = re.compile(r"(\d+)\s+comments?")
 
+def extract_front_page_items(html: Union[bytes, str]) -> BeautifulSoup:
+    """Parse HN front page HTML and return soup object.
 
-def extract_front_page_items(html: str) -> BeautifulSoup:
-    """Parse HN front page HTML and return soup object."""
-    return BeautifulSoup(html, "html.parser")
+    Accepts raw response bytes; lxml sniffs the encoding itself, which
+    avoids a separate Python-level decode of the whole page.
+    """
+    # libxml2-backed parser; tokenization and tree build run in C.
+    return BeautifulSoup(html, "lxml")
 
 
 def parse_points(text: Optional[str]) -> int:
+    # HN renders scores as "NNN points", so slicing up to the unit beats a
+    # regex scan on these ~20-char strings.
     if not text:
         return 0
-    match = POINTS_RE.search(text)
-    return int(match.group(1)) if match else 0
+    # As with comment counts, &nbsp; separators surface as U+00A0.
+    if "\xa0" in text:
+        text = text.replace("\xa0", " ")
+    i = text.find(" point")
+    return int(text[:i]) if i > 0 and text[:i].isdigit() else 0
 
 
 def parse_comments(text: Optional[str]) -> int:
-    if not text:
+    if not text or len(text) < 3:
         return 0
-    if "discuss" in text.lower():
+    # HN shows "discuss" only when the count is zero; matching on "iscuss"
+    # covers both capitalizations without allocating a lowered copy.
+    if "iscuss" in text:
         return 0
-    match = COMMENTS_RE.search(text)
-    return int(match.group(1)) if match else 0
+    # The live markup joins count and unit with &nbsp;, which get_text()
+    # and innerText surface as U+00A0 rather than an ASCII space.
+    if "\xa0" in text:
+        text = text.replace("\xa0", " ")
+    i = text.find(" comment")
+    return int(text[:i]) if i > 0 and text[:i].isdigit() else 0
+
+
+def new_record_columns() -> Dict[str, List]:
+    return {field: [] for field in FIELDS}
 
 
-def build_record(
+def append_record(
+    cols: Dict[str, List],
     *,
     post_id: int,
     title: str,
@@ -41,14 +70,12 @@ def build_record(
     author: Optional[str],
     top_comment_author: Optional[str],
     top_comment_text: Optional[str],
-) -> Dict[str, Optional[str]]:
-    return {
-        "post_id": str(post_id),
-        "title": title,
-        "url": url,
-        "points": points,
-        "comments_count": comments_count,
-        "author": author or "",
-        "top_comment_author": top_comment_author or "",
-        "top_comment_text": (top_comment_text or "").strip(),
-    }
+) -> None:
+    cols["post_id"].append(str(post_id))
+    cols["title"].append(title)
+    cols["url"].append(url)
+    cols["points"].append(points)
+    cols["comments_count"].append(comments_count)
+    cols["author"].append(author or "")
+    cols["top_comment_author"].append(top_comment_author or "")
+    cols["top_comment_text"].append((top_comment_text or "").strip())
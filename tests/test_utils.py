@@ -0,0 +1,31 @@
+from scrapers.utils import parse_comments, parse_points
+
+
+def test_parse_comments_nbsp_separator():
+    # Live HN markup joins count and unit with &nbsp; (U+00A0).
+    assert parse_comments("123\xa0comments") == 123
+    assert parse_comments("1\xa0comment") == 1
+
+
+def test_parse_comments_ascii_separator():
+    assert parse_comments("45 comments") == 45
+
+
+def test_parse_comments_no_count():
+    assert parse_comments("discuss") == 0
+    assert parse_comments("Discuss") == 0
+    assert parse_comments("") == 0
+    assert parse_comments(None) == 0
+    assert parse_comments("hide") == 0
+
+
+def test_parse_points():
+    assert parse_points("321 points") == 321
+    assert parse_points("1 point") == 1
+    assert parse_points("") == 0
+    assert parse_points(None) == 0
+
+
+def test_parse_points_nbsp_separator():
+    assert parse_points("123\xa0points") == 123
+    assert parse_points("1\xa0point") == 1